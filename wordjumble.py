@@ -10,69 +10,356 @@ How it works:
 3. Unscramble the final phrase from circled letters
 """
 
+import os
+import pickle
+import tempfile
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from functools import lru_cache
+from itertools import product
+from math import comb
+from pathlib import Path
 
-def get_file_lines(filename='/usr/share/dict/words'):
+# Fingerprint of each single letter: A-Z each get their own 5-bit slot,
+# with A in the highest slot. That way words whose sorted letters start the
+# same way have fingerprints that sort next to each other.
+LETTER_FINGERPRINTS = {chr(65 + i): 1 << (5 * (25 - i)) for i in range(26)}
+
+# Below this many ways to choose a word's letters, looking up each choice
+# is faster than walking the dictionary like a trie (see find_combinations)
+PRUNE_MIN_COMBINATIONS = 5000
+
+# Where built words dictionaries are saved between runs
+CACHE_DIR = Path('~/.cache/wordjumble').expanduser()
+
+
+@lru_cache(maxsize=4096)
+def letter_fingerprint(letters):
     """
-    Return a list of strings from the dictionary file.
-    Each line is stripped of whitespace and converted to uppercase.
+    Return an integer fingerprint counting how many times each letter appears.
+    Each letter A-Z gets its own 5-bit slot (counts up to 31), so anagrams
+    share the same fingerprint without sorting, and the fingerprint of two
+    groups of letters combined is just the sum of their fingerprints.
+    Results are cached, since puzzles look up the same short strings again.
     
     Args:
-        filename: Path to dictionary file
+        letters: String of uppercase letters A-Z
         
     Returns:
-        List of uppercase words
+        Integer fingerprint of the letter counts
+        
+    Example:
+        >>> letter_fingerprint('DOG') == letter_fingerprint('GOD')
+        True
+    """
+    return sum(map(LETTER_FINGERPRINTS.__getitem__, letters))
+
+
+def is_jumble_letters(letters):
+    """
+    Return whether a string is made only of the letters A-Z, so it can be
+    fingerprinted. Anything else (lowercase, spaces, accents, an empty
+    string) can never match a dictionary word.
+    
+    Args:
+        letters: String to check
+        
+    Returns:
+        True if letters is non-empty and only contains A-Z
+        
+    Example:
+        >>> is_jumble_letters('ILST'), is_jumble_letters('ilst'), is_jumble_letters('IL ST')
+        (True, False, False)
     """
-    with open(filename) as file:
-        lines = [line.strip().upper() for line in file]
-    return lines
+    return letters.isascii() and letters.isalpha() and letters.isupper()
 
 
-def sorted_letters(scrambled_letters):
+def letter_counts(fingerprint):
     """
-    Return a string with letters sorted in alphabetical order.
+    Return the letters in a fingerprint along with how many times each appears.
+    This reads the counts straight out of each letter's 5-bit slot, so it
+    works like a counting sort: the letters come out in alphabetical order
+    without ever being compared.
     
     Args:
-        scrambled_letters: String of scrambled letters
+        fingerprint: Integer fingerprint of some letters
         
     Returns:
-        String with same letters in sorted order
+        List of (letter fingerprint, count) pairs in alphabetical order,
+        leaving out letters that don't appear
         
     Example:
-        >>> sorted_letters('DOG')
-        'DGO'
+        >>> letter_counts(letter_fingerprint('BAB')) == [
+        ...     (LETTER_FINGERPRINTS['A'], 1), (LETTER_FINGERPRINTS['B'], 2)]
+        True
     """
-    return ''.join(sorted(scrambled_letters))
+    counts = []
+    for letter_fp in LETTER_FINGERPRINTS.values():
+        count = (fingerprint // letter_fp) & 31
+        if count > 0:
+            counts.append((letter_fp, count))
+    return counts
+
+
+class WordIndex:
+    """
+    Words grouped by letter fingerprint, packed into three flat pieces
+    instead of a dict holding one list of separate strings per key:
+    
+        fingerprints: Sorted list of every distinct letter fingerprint
+        offsets: Where each fingerprint's words start in words_blob,
+                 plus one final entry marking the end
+        words_blob: Every word followed by a newline, grouped by fingerprint
+    
+    Lookups binary search the fingerprints, then split that group's slice
+    of the blob. It supports the same get()/[]/in/len() as a dict, so it
+    can be used anywhere a words_dict is expected.
+    
+    Example:
+        >>> words_dict = create_words_dict(['DOG', 'GOD', 'CAT'])
+        >>> words_dict.get(letter_fingerprint('DGO'))
+        ['DOG', 'GOD']
+    """
+    
+    def __init__(self, fingerprints, offsets, words_blob):
+        self.fingerprints = fingerprints
+        self.offsets = offsets
+        self.words_blob = words_blob
+    
+    def find_combinations(self, fingerprint, k):
+        """
+        Generate (fingerprint, position) for each distinct combination of
+        k letters taken from the letters of a fingerprint that some words
+        have, like looking up everything multiset_fingerprints() makes.
+        
+        Letters are picked in alphabetical order, so a partly picked
+        combination fixes the counts of every letter up to its last letter
+        and says there are at least that many of the last letter. Since A
+        has the highest slot, every fingerprint like that lies in one range
+        of the sorted fingerprints, which works like a trie over sorted
+        letters laid out flat. A pick is dropped as soon as its range is
+        empty, and each binary search starts where its parent's ended, so a
+        finished combination is found by the same search that checked it.
+        This only pays off when there are thousands of combinations.
+        
+        Args:
+            fingerprint: Fingerprint of the letters to choose from
+            k: Number of letters in each combination
+            
+        Returns:
+            Generator of (fingerprint, position) pairs, with positions as
+            returned by find()
+            
+        Example:
+            >>> words_dict = create_words_dict(['DOG', 'GOD', 'CAT'])
+            >>> [words_dict.words_at(index) for _, index in
+            ...  words_dict.find_combinations(letter_fingerprint('DOGS'), 3)]
+            [['DOG', 'GOD']]
+        """
+        items = letter_counts(fingerprint)
+        fingerprints = self.fingerprints
+        
+        def pick(index, k, fingerprint, low):
+            # Ran out of distinct letters before picking enough
+            if index == len(items):
+                return
+            
+            # Skip this letter, then take one copy of it, then two, and so on
+            letter_fp, count = items[index]
+            yield from pick(index + 1, k, fingerprint, low)
+            for taken in range(1, min(count, k) + 1):
+                fingerprint += letter_fp
+                low = bisect_left(fingerprints, fingerprint, low)
+                if low == len(fingerprints):
+                    return
+                # The combination is complete, so the search just done
+                # has already found it if it's there
+                if taken == k:
+                    if fingerprints[low] == fingerprint:
+                        yield fingerprint, low
+                    return
+                # Largest fingerprint in this range: the last letter's slot
+                # and every slot after it filled up. Taking more copies
+                # only narrows the range, so stop here if it's empty.
+                if fingerprints[low] > fingerprint | ((letter_fp << 5) - 1):
+                    return
+                yield from pick(index + 1, k - taken, fingerprint, low)
+        
+        return pick(0, k, 0, 0)
+    
+    def find(self, fingerprint):
+        """Return the position of fingerprint, or -1 if no words have it."""
+        index = bisect_left(self.fingerprints, fingerprint)
+        if index < len(self.fingerprints) and self.fingerprints[index] == fingerprint:
+            return index
+        return -1
+    
+    def words_at(self, index):
+        """Return the list of words stored at a position returned by find()."""
+        # Leave off the newline after the last word so split() doesn't add ''
+        start, end = self.offsets[index], self.offsets[index + 1] - 1
+        return self.words_blob[start:end].split('\n')
+    
+    def first_word_at(self, index):
+        """Return just the first word stored at a position returned by find()."""
+        start = self.offsets[index]
+        return self.words_blob[start:self.words_blob.index('\n', start)]
+    
+    def get(self, fingerprint, default=None):
+        index = self.find(fingerprint)
+        if index < 0:
+            return default
+        return self.words_at(index)
+    
+    def __getitem__(self, fingerprint):
+        index = self.find(fingerprint)
+        if index < 0:
+            raise KeyError(fingerprint)
+        return self.words_at(index)
+    
+    def __contains__(self, fingerprint):
+        return self.find(fingerprint) >= 0
+    
+    def __len__(self):
+        return len(self.fingerprints)
+    
+    def word_count(self):
+        """Return how many words are stored across every fingerprint."""
+        # Every word in the blob is followed by exactly one newline
+        return self.words_blob.count('\n')
 
 
 def create_words_dict(words_list):
     """
-    Create a dictionary mapping sorted letters to list of valid words.
-    This enables O(1) lookup instead of O(n) linear search.
+    Create a dictionary mapping letter fingerprints to list of valid words.
+    This enables O(log n) binary search lookup instead of O(n) linear search,
+    while storing all the words in one string rather than one object each.
+    Words containing anything other than the letters A-Z are skipped,
+    since they can never be the answer to a jumble.
     
     Args:
-        words_list: List of dictionary words
+        words_list: Iterable of uppercase dictionary words
         
     Returns:
-        Dictionary where keys are sorted letters, values are lists of words
+        WordIndex where keys are letter fingerprints, values are lists of words
         
     Example:
         >>> words_dict = create_words_dict(['DOG', 'GOD', 'CAT'])
-        >>> words_dict['DGO']
+        >>> words_dict[letter_fingerprint('DGO')]
         ['DOG', 'GOD']
     """
-    words_dict = {}
+    # Missing keys start out as an empty list, so each word is a single lookup
+    groups = defaultdict(list)
     
     # Loop through each word in the dictionary
     for word in words_list:
-        # Get the sorted version of the word's letters
-        key = sorted_letters(word)
+        # Skip words with apostrophes, accents, lowercase letters, etc.
+        if not is_jumble_letters(word):
+            continue
         
-        # If this key doesn't exist yet, create an empty list
-        if key not in words_dict:
-            words_dict[key] = []
+        # Get the fingerprint of the word's letters
+        # (every word is seen once here, so skip the cache)
+        key = letter_fingerprint.__wrapped__(word)
         
         # Add this word to the list for this key
-        words_dict[key].append(word)
+        groups[key].append(word)
+    
+    # Pack the groups into one string in fingerprint order, remembering
+    # where each group starts
+    fingerprints = sorted(groups)
+    offsets = array('I', [0])
+    blob_parts = []
+    for key in fingerprints:
+        group = '\n'.join(groups[key]) + '\n'
+        blob_parts.append(group)
+        offsets.append(offsets[-1] + len(group))
+    
+    return WordIndex(fingerprints, offsets, ''.join(blob_parts))
+
+
+def build_words_dict(filename='/usr/share/dict/words'):
+    """
+    Create the words dictionary straight from the dictionary file.
+    The file is read as bytes and uppercased in one go, which only touches
+    ASCII letters and avoids a Unicode-aware upper() call on every line.
+    Lines that aren't purely ASCII letters are dropped before decoding.
+    
+    Args:
+        filename: Path to dictionary file
+        
+    Returns:
+        WordIndex where keys are letter fingerprints, values are lists of words
+    """
+    with open(filename, 'rb') as file:
+        lines = file.read().upper().splitlines()
+    words = (line.strip() for line in lines)
+    return create_words_dict(word.decode('ascii') for word in words if word.isalpha())
+
+
+def load_words_dict(filename='/usr/share/dict/words'):
+    """
+    Return the words dictionary, reusing a copy saved by an earlier run.
+    The saved copy is named after the dictionary file's modification time,
+    so editing or replacing the file makes it build a fresh one.
+    
+    Args:
+        filename: Path to dictionary file
+        
+    Returns:
+        WordIndex where keys are letter fingerprints, values are lists of words
+    """
+    dict_path = Path(filename)
+    dict_mtime = dict_path.stat().st_mtime_ns
+    cache_path = CACHE_DIR / f'{dict_path.name}-{dict_mtime}.index2.pkl'
+    
+    # Use the saved copy if there is one; a missing, unreadable or corrupt
+    # copy just means rebuilding
+    try:
+        with open(cache_path, 'rb') as file:
+            parts = pickle.load(file)
+        if isinstance(parts, tuple) and len(parts) == 3:
+            return WordIndex(*parts)
+    except (OSError, pickle.UnpicklingError, EOFError, TypeError, ValueError):
+        pass
+    
+    words_dict = build_words_dict(filename)
+    
+    # Save a copy for next time. Each run writes its own temporary file and
+    # then renames it into place, so concurrent runs never write to the same
+    # file and readers only ever see a complete cache. Not being able to
+    # save is fine.
+    temp_path = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as file:
+            # Save the plain pieces rather than the WordIndex itself, so the
+            # cache loads the same whether this runs as a script or a module
+            parts = (words_dict.fingerprints, words_dict.offsets, words_dict.words_blob)
+            pickle.dump(parts, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+        temp_path = None
+        
+        # Remove copies saved for older versions of the dictionary file,
+        # which are named after it and an earlier modification time
+        prefix = f'{dict_path.name}-'
+        for old_path in CACHE_DIR.iterdir():
+            old_name = old_path.name
+            if (old_path != cache_path and old_name.startswith(prefix)
+                    and old_name.endswith('.pkl')
+                    and old_name[len(prefix):].split('.')[0].isdigit()):
+                try:
+                    old_path.unlink()
+                except OSError:
+                    pass
+    except OSError:
+        # Don't leave a partly written temporary file behind
+        if temp_path is not None:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
     
     return words_dict
 
@@ -83,7 +370,7 @@ def solve_one_jumble(letters, words_dict):
     
     Args:
         letters: String of scrambled letters
-        words_dict: Dictionary mapping sorted letters to valid words
+        words_dict: Dictionary mapping letter fingerprints to valid words
         
     Returns:
         List of valid words that match the scrambled letters
@@ -92,8 +379,12 @@ def solve_one_jumble(letters, words_dict):
         >>> solve_one_jumble('ILST', words_dict)
         ['LIST', 'SILT', 'SLIT']
     """
-    # Sort the scrambled letters to create a lookup key
-    key = sorted_letters(letters)
+    # Letters other than A-Z can't be fingerprinted and never match
+    if not is_jumble_letters(letters):
+        return []
+    
+    # Fingerprint the scrambled letters to create a lookup key
+    key = letter_fingerprint(letters)
     
     # Look up this key in our dictionary
     # Use .get() with empty list as default in case key doesn't exist
@@ -102,52 +393,101 @@ def solve_one_jumble(letters, words_dict):
     return valid_words
 
 
-def get_combinations(items, k):
+def solve_one_jumble_first(letters, words_dict):
     """
-    Generate combinations using nested loops with indices.
-    """
-    n = len(items)
-    result = []
-    
-    # Add this validation
-    if k > n or k < 0:
-        return []
-    if k == 0:
-        return [()]
+    Return only the first word that the given letters unscramble into.
+    Cheaper than solve_one_jumble when the full list isn't needed, since
+    it never builds the list of matching words.
     
-    # We'll use indices to track which items to pick
-    indices = list(range(k))  # Start with [0, 1, 2, ..., k-1]
+    Args:
+        letters: String of scrambled letters
+        words_dict: WordIndex mapping letter fingerprints to valid words
+        
+    Returns:
+        The first matching word, or None if there is no match
+        
+    Example:
+        >>> solve_one_jumble_first('ILST', words_dict)
+        'LIST'
+    """
+    if not is_jumble_letters(letters):
+        return None
+    index = words_dict.find(letter_fingerprint(letters))
+    if index < 0:
+        return None
+    return words_dict.first_word_at(index)
+
+
+def multiset_fingerprints(fingerprint, k):
+    """
+    Generate the fingerprint of each distinct combination of k letters
+    taken from the letters of a fingerprint.
+    The running fingerprint is updated as each letter's count is chosen,
+    so producing a combination costs no extra work beyond choosing it.
+    Repeated letters don't produce the same combination more than once.
     
-    while True:
-        # Add current combination
-        combo = tuple(items[i] for i in indices)
-        result.append(combo)
+    Args:
+        fingerprint: Fingerprint of the letters to choose from
+        k: Number of letters in each combination
         
-        # Find the rightmost index that can be incremented
-        i = k - 1
-        while i >= 0 and indices[i] == n - k + i:
-            i -= 1
+    Returns:
+        Generator of integer fingerprints, one per combination
         
-        # If no index can be incremented, we're done
-        if i < 0:
-            break
+    Example:
+        >>> sorted([letter_fingerprint('TT'), letter_fingerprint('TU')]) == sorted(
+        ...     multiset_fingerprints(letter_fingerprint('TTU'), 2))
+        True
+    """
+    items = letter_counts(fingerprint)
+    
+    def pick(index, k, fingerprint):
+        # Nothing left to pick, so the combination is complete
+        if k == 0:
+            yield fingerprint
+            return
+        # Ran out of distinct letters before picking enough
+        if index == len(items):
+            return
         
-        # Increment this index and reset all indices to its right
-        indices[i] += 1
-        for j in range(i + 1, k):
-            indices[j] = indices[j - 1] + 1
+        # Skip this letter, then take one copy of it, then two, and so on,
+        # filling the rest of the combination from the letters after it
+        letter_fp, count = items[index]
+        yield from pick(index + 1, k, fingerprint)
+        for taken in range(1, min(count, k) + 1):
+            fingerprint += letter_fp
+            yield from pick(index + 1, k - taken, fingerprint)
     
-    return result
+    return pick(0, k, 0)
+
+
+def circled_letters(word, circled_blanks):
+    """
+    Return the letters of a solved word that sit in circled positions.
+    
+    Args:
+        word: Solved word
+        circled_blanks: Circle pattern for the word ('O' = circled, '_' = not)
+        
+    Returns:
+        String of the circled letters, in order
+        
+    Example:
+        >>> circled_letters('CAMEO', '___O_')
+        'E'
+    """
+    return ''.join(letter for letter, blank in zip(word, circled_blanks) if blank == 'O')
 
 
-def solve_final_jumble(letters, final_circles, words_dict):
+def solve_final_jumble(letters, final_circles, words_dict, verbose=True):
     """
     Solve the final jumbled phrase by unscrambling the given letters.
     
     Args:
         letters: String of scrambled letters from circled positions
         final_circles: List of strings showing word lengths (e.g., ['OOOO', 'OOO'])
-        words_dict: Dictionary mapping sorted letters to valid words
+        words_dict: WordIndex mapping letter fingerprints to valid words
+        verbose: Whether to print a message when the circles don't match
+                 the number of letters
         
     Returns:
         List of tuples, each tuple contains words forming a valid phrase
@@ -159,51 +499,57 @@ def solve_final_jumble(letters, final_circles, words_dict):
     # Validate that number of circles matches number of letters
     num_circles = sum(len(circles) for circles in final_circles)
     if num_circles != len(letters):
-        print('Number of circles does not match number of letters.')
+        if verbose:
+            print('Number of circles does not match number of letters.')
         return []
     
-    # If final jumble is just one word, solve it as a single jumble
-    num_groups = len(final_circles)
-    if num_groups == 1:
-        words = solve_one_jumble(letters, words_dict)
-        return [(word,) for word in words]
-    
-    # Multi-word case
+    # No words to find, so there is no phrase
     group_sizes = [len(circles) for circles in final_circles]
+    if len(group_sizes) == 0:
+        return []
+    
+    # Letters other than A-Z can't be fingerprinted and never match
+    if not is_jumble_letters(letters):
+        return []
+    
     valid_phrases = []
-    seen = set()
     
-    # For 2-word case
-    if len(group_sizes) == 2:
-        first_word_length = group_sizes[0]
+    def solve_groups(remaining_fp, group_sizes, word_lists):
+        # The last word must use up all the remaining letters
+        if len(group_sizes) == 1:
+            last_words = words_dict.get(remaining_fp)
+            if last_words:
+                valid_phrases.extend(product(*word_lists, last_words))
+            return
         
-        # Use our custom combinations function
-        for combo in get_combinations(letters, first_word_length):
-            # combo is a tuple like ('M', 'U', 'T', 'T')
-            first_word_letters = ''.join(combo)
-            
-            # Get remaining letters for second word
-            remaining = list(letters)
-            for letter in combo:
-                remaining.remove(letter)
-            second_word_letters = ''.join(remaining)
-            
-            # Check if both form valid words
-            first_words = solve_one_jumble(first_word_letters, words_dict)
-            second_words = solve_one_jumble(second_word_letters, words_dict)
-            
-            # If both are valid, add all combinations
-            for word1 in first_words:
-                for word2 in second_words:
-                    phrase = (word1, word2)
-                    if phrase not in seen:
-                        seen.add(phrase)
-                        valid_phrases.append(phrase)
+        # Try each distinct set of letters for the next word, and only
+        # split the leftover letters further if those letters form a word.
+        # With enough combinations it's cheaper to walk the dictionary like
+        # a trie and drop dead ends early than to look up every one.
+        word_size = group_sizes[0]
+        if comb(sum(group_sizes), word_size) >= PRUNE_MIN_COMBINATIONS:
+            matches = words_dict.find_combinations(remaining_fp, word_size)
+        else:
+            matches = ((word_fp, words_dict.find(word_fp))
+                       for word_fp in multiset_fingerprints(remaining_fp, word_size))
+        for word_fp, index in matches:
+            if index < 0:
+                continue
+            word_lists.append(words_dict.words_at(index))
+            solve_groups(remaining_fp - word_fp, group_sizes[1:], word_lists)
+            word_lists.pop()
     
-    return valid_phrases
+    # Work entirely with fingerprints, so the search only adds, subtracts
+    # and looks up ints and never touches a string until a match is found
+    solve_groups(letter_fingerprint(letters), group_sizes, [])
+    
+    # Each split is visited once, but a group can hold the same word twice
+    # (e.g. 'Mark' and 'mark' both uppercase to 'MARK'), so drop repeated
+    # phrases in one pass while keeping their order
+    return list(dict.fromkeys(valid_phrases))
 
 
-def solve_word_jumble(letters, circles, final, words_dict):
+def solve_word_jumble(letters, circles, final, words_dict, verbose=True):
     """
     Solve a complete word jumble puzzle.
     
@@ -212,7 +558,12 @@ def solve_word_jumble(letters, circles, final, words_dict):
         circles: List of circle patterns (e.g., ['___O_', '__OO_', ...])
                  'O' = circled letter, '_' = not circled
         final: List showing final jumble pattern (e.g., ['OOOOOOO'])
-        words_dict: Dictionary mapping sorted letters to valid words
+        words_dict: WordIndex mapping letter fingerprints to valid words
+        verbose: Whether to print every solution; when False nothing is
+                 printed and only the first solution of each jumble is found
+        
+    Returns:
+        List of tuples, each tuple contains words forming a valid final phrase
     """
     final_letters = ''
     
@@ -221,37 +572,80 @@ def solve_word_jumble(letters, circles, final, words_dict):
         scrambled_letters = letters[index]
         circled_blanks = circles[index]
         
-        # Unscramble the letters
-        words = solve_one_jumble(scrambled_letters, words_dict)
-        
-        # Display results
-        print(f'Jumble {index+1}: {scrambled_letters} => ', end='')
-        if len(words) == 0:
-            print('(no solution)')
-            continue
-        print(f'unscrambled into {len(words)} words: {" or ".join(words)}')
+        # Only the first solution is used for the circled letters, so
+        # skip building the full list when it won't be displayed
+        if not verbose:
+            first_word = solve_one_jumble_first(scrambled_letters, words_dict)
+            if first_word is None:
+                continue
+        else:
+            # Unscramble the letters
+            words = solve_one_jumble(scrambled_letters, words_dict)
+            
+            # Display results, building the whole line before one print call
+            if len(words) == 0:
+                print(f'Jumble {index+1}: {scrambled_letters} => (no solution)')
+                continue
+            print(f'Jumble {index+1}: {scrambled_letters} => '
+                  f'unscrambled into {len(words)} words: {" or ".join(words)}')
+            first_word = words[0]
         
         # Extract circled letters from the first valid solution
-        for letter, blank in zip(words[0], circled_blanks):
-            if blank == 'O':
-                final_letters += letter
+        final_letters += circled_letters(first_word, circled_blanks)
     
     # Check if we solved any jumbles
     if len(final_letters) == 0:
-        print('Did not solve any jumbles, so could not solve final jumble.')
-        return
+        if verbose:
+            print('Did not solve any jumbles, so could not solve final jumble.')
+        return []
     
     # Solve the final jumble
-    final_results = solve_final_jumble(final_letters, final, words_dict)
+    final_results = solve_final_jumble(final_letters, final, words_dict, verbose)
+    if not verbose:
+        return final_results
     
-    # Display final results
-    print(f'Final Jumble: {final_letters} => ', end='')
+    # Display final results, with all the options joined into one print call
     if len(final_results) == 0:
-        print('(no solution)')
-        return
-    print(f'unscrambled into {len(final_results)} possible phrases:')
-    for num, result in enumerate(final_results):
-        print(f'    Option {num+1}: {" ".join(result)}')
+        print(f'Final Jumble: {final_letters} => (no solution)')
+        return final_results
+    lines = [f'Final Jumble: {final_letters} => '
+             f'unscrambled into {len(final_results)} possible phrases:']
+    lines.extend(f'    Option {num+1}: {" ".join(result)}'
+                 for num, result in enumerate(final_results))
+    print('\n'.join(lines))
+    return final_results
+
+
+def solve_word_jumbles(puzzles, words_dict):
+    """
+    Solve many word jumble puzzles at once without printing anything.
+    Only the first word of each jumble is looked up, since that's all the
+    circled letters come from, then each final jumble is solved.
+    
+    Args:
+        puzzles: List of (letters, circles, final) tuples, each in the
+                 same form as the arguments to solve_word_jumble
+        words_dict: WordIndex mapping letter fingerprints to valid words
+        
+    Returns:
+        List with the final phrases for each puzzle, in the same order
+    """
+    all_results = []
+    for letters, circles, final in puzzles:
+        final_letters = ''
+        for scrambled_letters, circled_blanks in zip(letters, circles):
+            first_word = solve_one_jumble_first(scrambled_letters, words_dict)
+            if first_word is None:
+                continue
+            # Extract circled letters from the first valid solution
+            final_letters += circled_letters(first_word, circled_blanks)
+        
+        if len(final_letters) == 0:
+            all_results.append([])
+        else:
+            all_results.append(solve_final_jumble(final_letters, final, words_dict, verbose=False))
+    
+    return all_results
 
 
 def test_solve_word_jumble_1(words_dict):
@@ -294,23 +688,50 @@ def test_solve_word_jumble_4(words_dict):
     solve_word_jumble(letters, circles, final, words_dict)
 
 
+def test_solve_word_jumble_5(words_dict):
+    """Test Case 5: Batch of puzzles solved silently, including a three word final"""
+    print('\n' + '='*20 + ' WORD JUMBLE TEST CASE 5 ' + '='*20)
+    puzzles = [
+        # Same jumbles as test case 2 with different circles
+        # Cartoon prompt: "Where the dog wants to be: __ __ ____."
+        (['TARFD', 'JOBUM', 'TENJUK', 'LETHEM'],
+         ['__O_O', '___OO', '____O_', 'O__OO_'],
+         ['OO', 'OO', 'OOOO']),  # Final jumble is 3 words with 2, 2 and 4 letters
+        # Test cases 1 and 4 again
+        (['ACOME', 'FEROC', 'REDDEG', 'YURFIP'],
+         ['___O_', '__OO_', 'O_O___', 'O__O__'],
+         ['OOOOOOO']),
+        (['TEFON', 'SOKIK', 'NIUMEM', 'SICONU'],
+         ['__O_O', 'OO_O_', '____O_', '___OO_'],
+         ['OO', 'OOOOOO']),
+    ]
+    all_results = solve_word_jumbles(puzzles, words_dict)
+    
+    for num, (puzzle, final_results) in enumerate(zip(puzzles, all_results)):
+        # Batch mode should agree with solving the puzzle on its own
+        matches = final_results == solve_word_jumble(*puzzle, words_dict, verbose=False)
+        if len(final_results) == 0:
+            print(f'Puzzle {num+1}: (no solution), matches single solve: {matches}')
+            continue
+        print(f'Puzzle {num+1}: {len(final_results)} possible phrases, '
+              f'first is {" ".join(final_results[0])}, matches single solve: {matches}')
+
+
 def main():
     """Main entry point for the program"""
-    print("Loading dictionary...")
-    words_list = get_file_lines('/usr/share/dict/words')
-    print(f"Loaded {len(words_list)} words")
-    
-    print("\nCreating words dictionary...")
-    words_dict = create_words_dict(words_list)
+    print("Loading dictionary and creating words dictionary...")
+    words_dict = load_words_dict('/usr/share/dict/words')
+    num_words = words_dict.word_count()
+    print(f"Loaded {num_words} words")
     print(f"Created dictionary with {len(words_dict)} unique letter combinations")
     
     # Test the words_dict with examples
     print("\n" + "="*60)
     print("Testing words_dict lookups:")
-    print(f"words_dict['DGO'] = {words_dict.get('DGO', [])}")
-    print(f"words_dict['CDEO'] = {words_dict.get('CDEO', [])}")
-    print(f"words_dict['ILST'] = {words_dict.get('ILST', [])}")
-    print(f"words_dict['EILNST'] = {words_dict.get('EILNST', [])}")
+    print(f"words_dict[letter_fingerprint('DGO')] = {words_dict.get(letter_fingerprint('DGO'), [])}")
+    print(f"words_dict[letter_fingerprint('CDEO')] = {words_dict.get(letter_fingerprint('CDEO'), [])}")
+    print(f"words_dict[letter_fingerprint('ILST')] = {words_dict.get(letter_fingerprint('ILST'), [])}")
+    print(f"words_dict[letter_fingerprint('EILNST')] = {words_dict.get(letter_fingerprint('EILNST'), [])}")
     print("="*60 + "\n")
     
     # Run all test cases
@@ -318,6 +739,7 @@ def main():
     test_solve_word_jumble_2(words_dict)
     test_solve_word_jumble_3(words_dict)
     test_solve_word_jumble_4(words_dict)
+    test_solve_word_jumble_5(words_dict)
 
 
 if __name__ == '__main__':